@@ -13,6 +13,9 @@ class Args:
     speed: float
     ui: bool
     phase: float
+    backend: str
+    device: str
+    print_circuit: bool
 
 
 def parse_args() -> Args:
@@ -29,6 +32,9 @@ def parse_args() -> Args:
         speed=ns.speed,
         ui=ns.ui,
         phase=ns.phase,
+        backend=ns.backend,
+        device=ns.device,
+        print_circuit=ns.print_circuit,
     )
 
 
@@ -74,5 +80,24 @@ def parse_cli(base_parser: ArgumentParser) -> None:
             "Defaults to π, which implements the usual sign flip e^(iπ) = -1."
         ),
     )
+    parser.add_argument(
+        "-b",
+        "--backend",
+        choices=("numpy", "aer"),
+        default="numpy",
+        help="Statevector simulation backend: closed-form NumPy updates or Qiskit Aer (default: numpy)",
+    )
+    parser.add_argument(
+        "-d",
+        "--device",
+        choices=("cpu", "gpu"),
+        default="cpu",
+        help="Device holding the statevector: Aer's simulator or CuPy arrays for numpy (default: cpu)",
+    )
+    parser.add_argument(
+        "--print-circuit",
+        action="store_true",
+        help="Print the circuit of a single Grover iteration once before running",
+    )
 
     parser.add_argument("--ui", action="store_true", help="Run with DearPyGui UI")
@@ -1,14 +1,30 @@
+import cmath
 import math
+from functools import cache
 
+import numpy as np
 from qiskit import QuantumCircuit
-from qiskit.circuit.library import PhaseGate
+from qiskit.circuit.library import DiagonalGate, PhaseGate, UnitaryGate
 
 from .state import QubitState
 
+# With `fused=True`, up to this many qubits the oracle and diffusion are
+# appended as one precomputed gate. A dense diffusion matrix costs 4^n per
+# application against roughly (4n+1)·2^n for the gate sequence, so from 5
+# qubits on the gate-by-gate form is cheaper (and the matrix quickly gets huge).
+FUSED_GATE_MAX_QUBITS = 4
 
-def oracle(qc: QuantumCircuit, target_state: QubitState, /, *, phase: float = math.pi) -> None:
-    """Oracle that flips the sign of the target state."""
+
+def oracle(qc: QuantumCircuit, target_state: QubitState, /, *, phase: float = math.pi, fused: bool = False) -> None:
+    """Oracle that flips the sign of the target state.
+
+    With `fused`, small registers get a single diagonal gate instead of the
+    gate sequence; cheaper to simulate, but opaque when drawn.
+    """
     n = len(target_state)
+    if fused and n <= FUSED_GATE_MAX_QUBITS:
+        qc.append(_oracle_gate(target_state, phase), range(n))
+        return
     encode_target_state(qc, target_state)
     apply_phase_inversion(qc, n, phase=phase)
     encode_target_state(qc, target_state)  # Undo
@@ -21,8 +37,15 @@ def oracle_circuit(target: QubitState, /, *, phase: float = math.pi) -> QuantumC
     return qc
 
 
-def diffusion(qc: QuantumCircuit, n: int, /, *, phase: float = math.pi) -> None:
-    """Apply the Grovers diffusion operator."""
+def diffusion(qc: QuantumCircuit, n: int, /, *, phase: float = math.pi, fused: bool = False) -> None:
+    """Apply the Grovers diffusion operator.
+
+    With `fused`, small registers get a single dense gate instead of the
+    gate sequence; cheaper to simulate, but opaque when drawn.
+    """
+    if fused and n <= FUSED_GATE_MAX_QUBITS:
+        qc.append(_diffusion_gate(n, phase), range(n))
+        return
     qc.h(range(n))
     qc.x(range(n))
     apply_phase_inversion(qc, n, phase=phase)
@@ -36,11 +59,42 @@ def diffusion_circuit(n: int, /, *, phase: float = math.pi) -> QuantumCircuit:
     return qc
 
 
+@cache
+def _oracle_gate(target_state: QubitState, phase: float) -> DiagonalGate:
+    """Return the oracle as a diagonal gate: e^(iφ) on the target, 1 elsewhere."""
+    diag = [1.0 + 0j] * (1 << len(target_state))
+    diag[target_state.as_index()] = cmath.exp(1j * phase)
+    gate = DiagonalGate(diag)
+    gate.label = "Oracle"
+    return gate
+
+
+@cache
+def _diffusion_gate(n: int, phase: float) -> UnitaryGate:
+    """Return the diffusion operator I + (e^(iφ) - 1)|s⟩⟨s| as a single dense gate."""
+    dim = 1 << n
+    # every entry of |s⟩⟨s| is 1/2^n
+    matrix = np.eye(dim, dtype=np.complex128) + (cmath.exp(1j * phase) - 1) / dim
+    return UnitaryGate(matrix, label="Diffusion")
+
+
+def grover_iteration(qc: QuantumCircuit, target: QubitState, /, *, phase: float = math.pi, fused: bool = False) -> None:
+    """Apply a single Grover iteration (oracle followed by diffusion)."""
+    oracle(qc, target, phase=phase, fused=fused)
+    diffusion(qc, len(target), phase=phase, fused=fused)
+
+
+def grover_iteration_circuit(target: QubitState, /, *, phase: float = math.pi, fused: bool = False) -> QuantumCircuit:
+    n = len(target)
+    qc = QuantumCircuit(n)
+    grover_iteration(qc, target, phase=phase, fused=fused)
+    return qc
+
+
 def encode_target_state(qc: QuantumCircuit, target_state: QubitState) -> None:
     """Apply X gates to qubits where the target state bit is '0'."""
-    for i, bit in enumerate(reversed(target_state)):
-        if bit == 0:
-            qc.x(i)
+    if target_state.zeros:  # `qc.x` rejects an empty qubit list
+        qc.x(target_state.zeros)
 
 
 def apply_phase_inversion(qc: QuantumCircuit, n: int, /, *, phase: float = math.pi) -> None:
@@ -1,15 +1,35 @@
-from grovers_visualizer.simulation import grover_evolver
+from grovers_visualizer.circuit import grover_iteration_circuit
+from grovers_visualizer.simulation import grover_evolver, is_cupy_available, is_gpu_available, make_simulator
 from grovers_visualizer.visualization import GroverVisualizer
 
 from .args import Args
 
 
 def run_cli(args: Args) -> None:
+    device = args.device
+    if device == "gpu" and args.backend == "aer" and not is_gpu_available():
+        print("GPU simulation is not available, falling back to CPU. Install with: pip install qiskit-aer-gpu")
+        device = "cpu"
+    if device == "gpu" and args.backend == "numpy" and not is_cupy_available():
+        print("CuPy GPU arrays are not available, falling back to CPU. Install with: pip install cupy-cuda12x")
+        device = "cpu"
+
+    if args.print_circuit:
+        print(grover_iteration_circuit(args.target, phase=args.phase).draw("text", fold=-1))
+
+    simulator = make_simulator(device) if args.backend == "aer" else None
     vis = GroverVisualizer(args.target, pause=args.speed)
 
-    for it, sv in grover_evolver(vis.target, args.iterations, phase=args.phase):
+    for it, amplitudes in grover_evolver(
+        vis.target,
+        args.iterations,
+        phase=args.phase,
+        backend=args.backend,
+        device=device,
+        simulator=simulator,
+    ):
         if not vis.is_running:
             break
-        vis.update(it, sv)
+        vis.update(it, amplitudes)
 
     vis.finalize()
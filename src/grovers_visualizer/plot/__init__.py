@@ -1,5 +1,16 @@
-from .amplitudes import plot_amplitudes
-from .circle import plot_circle
-from .sine import SinePlotData, plot_sine
+from .amplitudes import AmplitudeBars, create_bars, create_mean_line, plot_amplitudes
+from .circle import CircleArtists, create_circle, plot_circle
+from .sine import SinePlotData, create_sine, plot_sine
 
-__all__ = ("SinePlotData", "plot_amplitudes", "plot_circle", "plot_sine")
+__all__ = (
+    "AmplitudeBars",
+    "CircleArtists",
+    "SinePlotData",
+    "create_bars",
+    "create_circle",
+    "create_mean_line",
+    "create_sine",
+    "plot_amplitudes",
+    "plot_circle",
+    "plot_sine",
+)
@@ -1,39 +1,76 @@
+from dataclasses import dataclass
+
 import numpy as np
 import numpy.typing as npt
 from matplotlib.axes import Axes
-from matplotlib.container import BarContainer
-from qiskit.quantum_info import Statevector
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
 
 from grovers_visualizer.state import QubitState
-from grovers_visualizer.utils import get_bar_color
+from grovers_visualizer.utils import get_bar_color, is_optimal_iteration
+
+BAR_WIDTH = 0.8
+
+
+def bar_vertices(heights: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the (n_bars, 4, 2) rectangle vertices for bars of the given heights."""
+    centers = np.arange(len(heights))
+    verts = np.zeros((len(heights), 4, 2))
+    verts[:, :2, 0] = (centers - BAR_WIDTH / 2)[:, None]  # left edge
+    verts[:, 2:, 0] = (centers + BAR_WIDTH / 2)[:, None]  # right edge
+    verts[:, 1:3, 1] = heights[:, None]  # top edge, bottom stays at 0
+    return verts
+
+
+@dataclass
+class AmplitudeBars:
+    collection: PolyCollection
+    verts: npt.NDArray[np.float64]  # reused every frame, only the heights are rewritten
+    facecolors: npt.NDArray[np.float64]  # (n_bars, 4) RGBA, only the target row ever changes
+
+
+def create_bars(ax: Axes, basis_states: npt.NDArray[np.str_]) -> AmplitudeBars:
+    """Add a bar per basis state as a single collection, so they can be updated in bulk."""
+    verts = bar_vertices(np.zeros(len(basis_states)))
+    facecolors = np.tile(to_rgba(get_bar_color(is_target=False, is_optimal=False)), (len(basis_states), 1))
+    # ndarray verts hit PolyCollection's fast path, but the stubs only accept sequences
+    collection = PolyCollection(verts, facecolors=facecolors)  # type: ignore[arg-type]
+    ax.add_collection(collection)
+    ax.set_xticks(np.arange(len(basis_states)), basis_states)
+    ax.autoscale_view()
+    return AmplitudeBars(collection, verts, facecolors)
+
+
+def create_mean_line(ax: Axes) -> Line2D:
+    """Draw the zero axis and the mean line, which is then only moved each frame."""
+    ax.axhline(0, color="black", linewidth=0.5)
+    mean_line = ax.axhline(0, color="red", linestyle="--", label="Mean")
+    ax.legend(loc="upper right")
+    return mean_line
 
 
 def plot_amplitudes(
     ax: Axes,
-    bars: BarContainer,
-    statevector: Statevector,
-    basis_states: list[str],
+    bars: AmplitudeBars,
+    mean_line: Line2D,
+    statevector: npt.NDArray[np.complex64],
     iteration_label: str,
     iteration: int,
     target_state: QubitState | None = None,
     optimal_iteration: int | None = None,
 ) -> None:
-    amplitudes: npt.NDArray[np.float64] = statevector.data.real  # Real part of amplitudes
+    amplitudes: npt.NDArray[np.float32] = statevector.real  # Real part of amplitudes (a view, not a copy)
     mean = np.mean(amplitudes)
 
-    for bar, state, amp in zip(bars, basis_states, amplitudes, strict=False):
-        bar.set_height(amp)
-        bar.set_color(get_bar_color(state, target_state, iteration, optimal_iteration))
+    bars.verts[:, 1:3, 1] = amplitudes[:, None]  # top edge
+    bars.collection.set_verts(bars.verts)  # type: ignore[arg-type]
 
-    ax.set_title(f"Iteration {iteration}: {iteration_label}")
-    ax.set_ylim(-1, 1)
+    if target_state is not None:
+        is_optimal = optimal_iteration is not None and is_optimal_iteration(iteration, optimal_iteration)
+        bars.facecolors[target_state.as_index()] = to_rgba(get_bar_color(is_target=True, is_optimal=is_optimal))
+        bars.collection.set_facecolor(bars.facecolors)  # type: ignore[arg-type]
 
-    for l in ax.lines:  # Remove previous mean line(s)
-        l.remove()
+    mean_line.set_ydata([mean, mean])
 
-    # Draw axes and mean
-    ax.axhline(0, color="black", linewidth=0.5)
-    ax.axhline(float(mean), color="red", linestyle="--", label="Mean")
-
-    if not ax.get_legend():
-        ax.legend(loc="upper right")
+    ax.set_title(f"Iteration {iteration}: {iteration_label}")
@@ -1,19 +1,21 @@
+from dataclasses import dataclass
 from math import cos, sin
 
 from matplotlib.axes import Axes
-from matplotlib.patches import Circle
+from matplotlib.patches import Circle, FancyArrow
+from matplotlib.text import Text
 
 from grovers_visualizer.utils import is_optimal_iteration
 
 
-def plot_circle(
-    ax: Axes,
-    iteration: int,
-    optimal_iterations: int,
-    theta: float,
-    state_angle: float,
-) -> None:
-    ax.clear()
+@dataclass
+class CircleArtists:
+    arrow: FancyArrow
+    label: Text
+
+
+def create_circle(ax: Axes) -> CircleArtists:
+    """Draw the static parts of the circle plot and return the artists to update."""
     ax.set_aspect("equal")
     ax.set_xlim(-1.1, 1.1)
     ax.set_ylim(-1.1, 1.1)
@@ -35,29 +37,44 @@ def plot_circle(
     ax.text(-1.05, 0, "", va="center", ha="right", fontsize=10)
     ax.text(0, -1.05, "-1", va="top", ha="center", fontsize=10)
 
+    arrow = ax.arrow(0, 0, 1, 0, head_width=0.07, head_length=0.1, length_includes_head=True)
+    label = ax.text(
+        0,
+        0,
+        "",
+        fontsize=10,
+        fontweight="bold",
+        bbox={"facecolor": "white", "edgecolor": "none", "alpha": 0.7, "boxstyle": "round,pad=0.2"},
+    )
+    return CircleArtists(arrow, label)
+
+
+def plot_circle(
+    ax: Axes,
+    artists: CircleArtists,
+    iteration: int,
+    optimal_iterations: int,
+    theta: float,
+    state_angle: float,
+) -> None:
     angle = state_angle + iteration * theta
     x, y = cos(angle), sin(angle)
     is_optimal = is_optimal_iteration(iteration, optimal_iterations)
 
     # Arrow color: green at optimal, blue otherwise
     color = "green" if is_optimal else "blue"
-    ax.arrow(0, 0, x, y, head_width=0.07, head_length=0.1, fc=color, ec=color, length_includes_head=True)
+    artists.arrow.set_data(dx=x, dy=y)
+    artists.arrow.set_color(color)
 
     # Probability of target state is y^2
     prob = y**2
 
     # Draw the value at the tip of the arrow
-    ax.text(
-        x,
-        y,
-        f"{prob:.2f}",
-        color=color,
-        fontsize=10,
-        ha="left" if x >= 0 else "right",
-        va="bottom" if y >= 0 else "top",
-        fontweight="bold",
-        bbox={"facecolor": "white", "edgecolor": "none", "alpha": 0.7, "boxstyle": "round,pad=0.2"},
-    )
+    artists.label.set_position((x, y))
+    artists.label.set_text(f"{prob:.2f}")
+    artists.label.set_color(color)
+    artists.label.set_horizontalalignment("left" if x >= 0 else "right")
+    artists.label.set_verticalalignment("bottom" if y >= 0 else "top")
 
     ax.set_title(
         f"Grover State Vector Rotation\nIteration {iteration} | Probability of target: {prob}{' (optimal)' if is_optimal else ''}"
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
-from math import sin
 
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+
+from grovers_visualizer.utils import target_probability
 
 
 @dataclass
@@ -14,19 +16,37 @@ class SinePlotData:
         self.y.append(y)
 
     def calc_and_append_probability(self, iteration: int, theta: float) -> None:
-        prob = sin((2 * iteration + 1) * theta / 2) ** 2
-        self.append(iteration, prob)
+        self.append(iteration, target_probability(iteration, theta))
 
 
-def plot_sine(
-    ax: Axes,
-    sine_data: SinePlotData,
-) -> None:
-    ax.clear()
-    ax.plot(sine_data.x, sine_data.y, marker="o", color="purple", label="Target Probability")
+def create_sine(ax: Axes) -> Line2D:
+    """Draw the static parts of the sine plot and return the curve to update."""
+    (line,) = ax.plot([], [], marker="o", color="purple", label="Target Probability")
     ax.set_xlabel("Iteration")
     ax.set_ylabel("Probability")
     ax.set_title("Grover Target Probability vs. Iteration")
     ax.set_ylim(0, 1)
-    ax.set_xlim(0, max(10, max(sine_data.x) + 1))
+    ax.set_xlim(0, 10)
     ax.legend()
+    return line
+
+
+def plot_sine(
+    ax: Axes,
+    line: Line2D,
+    sine_data: SinePlotData,
+) -> bool:
+    """Update the curve; return True if the x-axis had to grow (needs a full redraw).
+
+    The x-axis doubles when the curve reaches its edge, so full redraws
+    only happen a logarithmic number of times over a run.
+    """
+    line.set_data(sine_data.x, sine_data.y)
+    needed = max(sine_data.x) + 1
+    xmax = ax.get_xlim()[1]
+    if needed <= xmax:
+        return False
+    while xmax < needed:
+        xmax *= 2
+    ax.set_xlim(0, xmax)
+    return True
@@ -1,39 +1,230 @@
+import cmath
 import math
 from collections.abc import Iterator
+from functools import cache
 from itertools import count
+from types import ModuleType
+from typing import Any
 
-from qiskit import QuantumCircuit
-from qiskit.qasm2.parse import Operator
+import numpy as np
+import numpy.typing as npt
+from qiskit import QuantumCircuit, transpile
 from qiskit.quantum_info import Statevector
+from qiskit_aer import AerSimulator
 
-from grovers_visualizer.circuit import diffusion_circuit, oracle_circuit
+from grovers_visualizer.circuit import grover_iteration_circuit
 from grovers_visualizer.state import QubitState
 
+# Finite Aer runs simulate this many iterations per job, which bounds the
+# statevectors held at once and the delay before the first frame.
+BATCH_BLOCK_SIZE = 16
+
 
 def grover_evolver(
     target: QubitState,
     max_iterations: int = 0,
     *,
     phase: float = math.pi,
-) -> Iterator[tuple[int, Statevector]]:
-    """Yields (iteration, statevector) pairs.
+    backend: str = "numpy",
+    device: str = "cpu",
+    simulator: AerSimulator | None = None,
+) -> Iterator[tuple[int, npt.NDArray[np.complex64]]]:
+    """Yields (iteration, amplitudes) pairs.
 
     - iteration=0 is the uniform-Hadamard initialization
     - max_iterations > 0, stop after that many iterations
     - max_iterations == 0, run indefinitely (until the consumer breaks)
+
+    Amplitudes are single precision (complex64) on every backend, which is
+    plenty for display. Every backend writes into a single array and
+    yields it every step, so consumers must copy it if they keep it around.
+
+    On device "gpu" the "numpy" backend keeps the state in a CuPy array
+    (see `is_cupy_available`) and copies it back to the host every step.
     """
     n_qubits = len(target)
-    qc = QuantumCircuit(n_qubits)
-    qc.h(range(n_qubits))
+    if backend == "aer":
+        # Aer returns doubles even in single precision; convert into one reused buffer
+        buf = np.empty(1 << n_qubits, dtype=np.complex64)
+        for i, sv in aer_grover_evolver(target, max_iterations, phase=phase, simulator=simulator):
+            np.copyto(buf, sv.data, casting="same_kind")
+            yield i, buf
+        return
 
-    # initial statevector
-    sv = Statevector.from_instruction(qc)
-    yield 0, sv
+    if device == "gpu":
+        import cupy  # optional, only needed for the GPU
+
+        buf = np.empty(1 << n_qubits, dtype=np.complex64)
+        for i, psi in array_grover_evolver(target, max_iterations, phase=phase, xp=cupy):
+            psi.get(out=buf)  # plotting needs the amplitudes on the host
+            yield i, buf
+        return
+
+    yield from array_grover_evolver(target, max_iterations, phase=phase, xp=np)
+
+
+def array_grover_evolver(
+    target: QubitState,
+    max_iterations: int = 0,
+    *,
+    phase: float = math.pi,
+    xp: ModuleType = np,
+) -> Iterator[tuple[int, Any]]:
+    """Yields (iteration, amplitudes) pairs, updating one `xp` array in place.
+
+    `xp` is any module with NumPy's array API, i.e. `numpy` or `cupy`.
+    """
+    n_qubits = len(target)
+    psi = xp.full(1 << n_qubits, 1 / math.sqrt(1 << n_qubits), dtype=xp.complex64)
+    yield 0, psi
 
-    oracle_op = Operator(oracle_circuit(target, phase=phase))
-    diffusion_op = Operator(diffusion_circuit(n_qubits, phase=phase))
+    target_idx = target.as_index()
+    phase_factor = cmath.exp(1j * phase)
 
     iters = range(1, max_iterations + 1) if max_iterations > 0 else count(1)
     for i in iters:
-        sv = sv.evolve(oracle_op).evolve(diffusion_op)
+        oracle_inplace(psi, target_idx, phase_factor)
+        diffusion_inplace(psi, phase_factor)
+        yield i, psi
+
+
+def oracle_inplace(psi: npt.NDArray[np.complex64], target_idx: int, phase_factor: complex) -> None:
+    """Apply the oracle, which only shifts the phase of the target amplitude."""
+    psi[target_idx] *= phase_factor
+
+
+def diffusion_inplace(psi: npt.NDArray[np.complex64], phase_factor: complex) -> None:
+    """Apply the diffusion operator I + (e^(iφ) - 1)|s⟩⟨s|.
+
+    |s⟩⟨s|ψ⟩ is the mean amplitude on every basis state, so the whole
+    operator is a single shift of all amplitudes.
+    """
+    psi += (phase_factor - 1) * psi.mean()
+
+
+def aer_grover_evolver(
+    target: QubitState,
+    max_iterations: int = 0,
+    *,
+    phase: float = math.pi,
+    simulator: AerSimulator | None = None,
+) -> Iterator[tuple[int, Statevector]]:
+    """Yields (iteration, statevector) pairs simulated with Qiskit Aer.
+
+    Finite runs are simulated a block of iterations per Aer job. Unbounded
+    runs submit one Grover iteration per job, seeded with the previous
+    statevector, so every step costs the same instead of replaying the
+    whole circuit.
+    """
+    if max_iterations > 0:
+        yield from batch_grover_evolver(target, max_iterations, phase=phase, simulator=simulator)
+        return
+
+    simulator = simulator or make_simulator()
+    step = transpile_step(target, simulator, phase=phase)
+
+    n_qubits = len(target)
+    qc = QuantumCircuit(n_qubits)
+    qc.h(range(n_qubits))
+    qc.save_statevector()
+    sv = simulator.run(qc).result().data(0)["statevector"]
+    yield 0, sv
+
+    # Aer applies the global phase before `set_statevector` overwrites the
+    # state, so it has to be added back to every step's result.
+    step_phase = cmath.exp(1j * step.global_phase)
+
+    for i in count(1):
+        qc = QuantumCircuit(n_qubits)
+        qc.set_statevector(sv)
+        qc.compose(step, inplace=True)
+        qc.save_statevector()
+        sv = simulator.run(qc).result().data(0)["statevector"] * step_phase
         yield i, sv
+
+
+def batch_grover_evolver(
+    target: QubitState,
+    max_iterations: int,
+    *,
+    phase: float = math.pi,
+    simulator: AerSimulator | None = None,
+    block_size: int = BATCH_BLOCK_SIZE,
+) -> Iterator[tuple[int, Statevector]]:
+    """Yields (iteration, statevector) pairs from one Aer run per block of iterations.
+
+    Each block saves the statevector after every iteration and is seeded
+    with the last statevector of the previous block, so memory and the
+    delay before the first frame are bounded by `block_size`, not by
+    `max_iterations`. A single iteration is transpiled (optimization
+    level 3) once and repeated.
+    """
+    simulator = simulator or make_simulator()
+    step = transpile_step(target, simulator, phase=phase)
+
+    n_qubits = len(target)
+    sv = Statevector.from_label("+" * n_qubits)
+    yield 0, sv
+
+    for start in range(1, max_iterations + 1, block_size):
+        stop = min(start + block_size, max_iterations + 1)
+        qc = QuantumCircuit(n_qubits)
+        qc.set_statevector(sv)
+        for i in range(start, stop):
+            qc.compose(step, inplace=True)
+            qc.save_statevector(label=f"it{i}")
+
+        data = simulator.run(qc).result().data()
+
+        # Aer applies the global phase before `set_statevector` overwrites the
+        # state, so add back the phase of the steps taken within this block.
+        for i in range(start, stop):
+            sv = data[f"it{i}"] * cmath.exp(1j * (i - start + 1) * step.global_phase)
+            yield i, sv
+
+
+def transpile_step(target: QubitState, simulator: AerSimulator, *, phase: float = math.pi) -> QuantumCircuit:
+    """Return a single Grover iteration transpiled (optimization level 3) for the simulator.
+
+    Small registers use the fused oracle/diffusion gates.
+    """
+    return transpile(grover_iteration_circuit(target, phase=phase, fused=True), simulator, optimization_level=3)
+
+
+def make_simulator(device: str = "cpu") -> AerSimulator:
+    """Return a statevector AerSimulator tuned for the small Grover circuits.
+
+    Gate fusion is enabled well below Aer's default 14-qubit threshold, so
+    the oracle/diffusion gates get fused into a few small unitaries, and
+    single precision halves the memory traffic over the statevector.
+    On "gpu" the statevector is simulated with cuStateVec.
+    """
+    if device == "gpu":
+        return AerSimulator(
+            method="statevector",
+            device="GPU",
+            precision="single",
+            cuStateVec_enable=True,
+        )
+    return AerSimulator(
+        method="statevector",
+        precision="single",
+        max_parallel_threads=0,  # all available cores
+        fusion_enable=True,
+        fusion_threshold=4,
+        fusion_max_qubit=5,
+    )
+
+
+def is_gpu_available() -> bool:
+    return "GPU" in AerSimulator().available_devices()
+
+
+@cache
+def is_cupy_available() -> bool:
+    """Return whether CuPy is installed and can see a CUDA device."""
+    try:
+        import cupy
+    except ImportError:
+        return False
+    return bool(cupy.cuda.is_available())
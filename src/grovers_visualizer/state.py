@@ -3,28 +3,64 @@ from typing import Self, override
 
 
 class QubitState:
-    def __init__(self, bits: Iterable[int]) -> None:
-        bits_tuple = tuple(bits)  # Convert to not consume it
-        if not all(b in (0, 1) for b in bits_tuple):
-            raise ValueError(f"{self.__class__.__name__} must be a tuple of `0`s and `1`s")
-        self._bits: tuple[int, ...] = tuple(bits_tuple)
+    __slots__ = ("_n", "_ones", "_value", "_zeros")
+
+    def __init__(self, value: int, n: int) -> None:
+        """Create the state `value` on `n` qubits; trusted input, not validated.
+
+        Use `from_str`, `from_bits` or `from_int` for untrusted input.
+        """
+        # Stored as an int, bits are derived on demand
+        self._value: int = value
+        self._n: int = n
+        # Qubit index lists are only needed to build circuits, computed on first access
+        self._zeros: tuple[int, ...] | None = None
+        self._ones: tuple[int, ...] | None = None
 
     @property
     def bits(self) -> tuple[int, ...]:
-        return self._bits
+        return tuple((self._value >> i) & 1 for i in reversed(range(self._n)))
 
     @property
     def bitsring(self) -> str:
-        return "".join(str(b) for b in self._bits)
+        return format(self._value, f"0{self._n}b") if self._n else ""
+
+    @property
+    def zeros(self) -> tuple[int, ...]:
+        """Qubit indices whose bit is `0` (qubit 0 is the rightmost bit)."""
+        if self._zeros is None:
+            self._zeros = tuple(i for i in range(self._n) if not (self._value >> i) & 1)
+        return self._zeros
+
+    @property
+    def ones(self) -> tuple[int, ...]:
+        """Qubit indices whose bit is `1` (qubit 0 is the rightmost bit)."""
+        if self._ones is None:
+            self._ones = tuple(i for i in range(self._n) if (self._value >> i) & 1)
+        return self._ones
+
+    def as_index(self) -> int:
+        """Return the index of this basis state in a statevector."""
+        return self._value
 
     @classmethod
     def from_str(cls, s: str) -> Self:
-        return cls(int(b) for b in s)
+        if not all(b in "01" for b in s):
+            raise ValueError(f"{cls.__name__} must be a string of `0`s and `1`s")
+        return cls(int(s, 2) if s else 0, len(s))
+
+    @classmethod
+    def from_bits(cls, bits: Iterable[int]) -> Self:
+        bits_tuple = tuple(bits)  # Convert to not consume it
+        if not all(b in (0, 1) for b in bits_tuple):
+            raise ValueError(f"{cls.__name__} must be a tuple of `0`s and `1`s")
+        return cls.from_str("".join(str(b) for b in bits_tuple))
 
     @classmethod
     def from_int(cls, value: int, num_qubits: int) -> Self:
-        bits = (int(x) for x in format(value, f"0{num_qubits}b"))
-        return cls(bits)
+        if not 0 <= value < 1 << num_qubits:
+            raise ValueError(f"{value} does not fit in {num_qubits} qubits")
+        return cls(value, num_qubits)
 
     @override
     def __str__(self) -> str:
@@ -37,7 +73,7 @@ class QubitState:
     @override
     def __eq__(self, value: object, /) -> bool:
         if isinstance(value, QubitState):
-            return self.bitsring == value.bitsring
+            return (self._value, self._n) == (value._value, value._n)
         if isinstance(value, str):
             return self.bitsring == value
         if isinstance(value, (list, tuple)):
@@ -46,25 +82,26 @@ class QubitState:
 
     def __lt__(self, value: object, /) -> bool:
         if isinstance(value, QubitState):
-            return int(self.bitsring, 2) < int(value.bitsring, 2)
+            return self._value < value._value
         if isinstance(value, str) and all(b in "01" for b in value):
-            return int(self.bitsring, 2) < int(value, 2)
+            return self._value < int(value, 2)
         if isinstance(value, (list, tuple)):
             return self.bits < tuple(value)
         return NotImplemented
 
     @override
     def __hash__(self) -> int:
+        # Must match `hash(str)`, since a state compares equal to its bitstring
         return hash(self.bitsring)
 
     def __len__(self) -> int:
-        return len(self._bits)
+        return self._n
 
     def __getitem__(self, idx: int | slice) -> int | tuple[int, ...]:
-        return self._bits[idx]
+        return self.bits[idx]
 
     def __iter__(self) -> Iterator[int]:
-        return iter(self._bits)
+        return iter(self.bits)
 
 
 Ket = QubitState
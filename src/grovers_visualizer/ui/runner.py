@@ -0,0 +1,29 @@
+from importlib.util import find_spec
+from typing import Final
+
+from grovers_visualizer.args import Args
+
+
+def _find_dearpygui() -> bool:
+    try:
+        return find_spec("dearpygui.dearpygui") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Looked up once at import, `find_spec` walks `sys.path` on every call
+_DPG_AVAILABLE: Final[bool] = _find_dearpygui()
+
+
+def is_dearpygui_available() -> bool:
+    return _DPG_AVAILABLE
+
+
+def run_dpg_ui(args: Args) -> None:
+    if not is_dearpygui_available():
+        print("DearPyGui is not installed. Install with: pip install 'grovers-visualizer[ui]'")
+        return
+
+    from .dpg import run_dearpygui_ui
+
+    run_dearpygui_ui(args)
@@ -1,35 +1,61 @@
 from collections.abc import Iterator
+from functools import cache
 from importlib.metadata import PackageNotFoundError, version
-from itertools import product
-from math import floor, pi, sqrt
+from math import asin, floor, pi, sin, sqrt
+
+import numpy as np
+import numpy.typing as npt
 
 from .state import QubitState
 
 
+def all_state_bits(n_qubits: int) -> npt.NDArray[np.uint8]:
+    """Return a (2**n, n) matrix with the bits of every basis state, most significant first."""
+    values = np.arange(1 << n_qubits, dtype=">u8")  # big-endian, so bytes unpack in reading order
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1)[:, 64 - n_qubits :]
+
+
+def all_state_labels(n_qubits: int) -> npt.NDArray[np.str_]:
+    """Return the bitstring label of every basis state, e.g. '0101'."""
+    digits = all_state_bits(n_qubits) + ord("0")  # ASCII digits, one byte per bit
+    return digits.view(f"S{n_qubits}").ravel().astype(np.str_)
+
+
 def all_states(n_qubits: int) -> Iterator[QubitState]:
     """Generate all possible QubitStates for n_qubits."""
-    for bits in product((0, 1), repeat=n_qubits):
-        yield QubitState(bits)
+    for value in range(1 << n_qubits):
+        yield QubitState(value, n_qubits)
 
 
+@cache
 def optimal_grover_iterations(n_qubits: int) -> int:
     """Return the optimal number of Grover iterations for n qubits."""
     return floor(pi / 4 * sqrt(2.0**n_qubits))
 
 
+def grover_angle(n_qubits: int) -> float:
+    """Return the rotation angle θ of a single Grover iteration for n qubits."""
+    return 2 * asin(1 / sqrt(2.0**n_qubits))
+
+
+def target_probability(iteration: int, theta: float) -> float:
+    """Return the probability of measuring the target after the given iteration."""
+    return sin((2 * iteration + 1) * theta / 2) ** 2
+
+
 def is_optimal_iteration(iteration: int, optimal_iteration: int) -> bool:
     return iteration == optimal_iteration
 
 
-def get_bar_color(state: str, target_state: QubitState | None, iteration: int, optimal_iteration: int | None) -> str:
-    """Return the color for a bar based on state and iteration."""
-    if state != target_state:
+@cache
+def get_bar_color(*, is_target: bool, is_optimal: bool) -> str:
+    """Return the color for a bar; only the target bar changes color at the optimal iteration."""
+    if not is_target:
         return "skyblue"
-    if optimal_iteration and is_optimal_iteration(iteration, optimal_iteration):
-        return "green"
-    return "orange"
+    return "green" if is_optimal else "orange"
 
 
+@cache
 def get_app_version() -> str:
     """Return the installed package version, e.g. '0.4.0'.
 
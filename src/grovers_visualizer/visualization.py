@@ -1,28 +1,41 @@
-from math import asin, sqrt
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
-from matplotlib.backend_bases import Event, KeyEvent
+import numpy as np
+import numpy.typing as npt
+from matplotlib.backend_bases import DrawEvent, Event, KeyEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.gridspec import GridSpec
-from qiskit.quantum_info import Statevector
 
-from grovers_visualizer.plot import SinePlotData, plot_amplitudes, plot_circle, plot_sine
+from grovers_visualizer.plot import (
+    AmplitudeBars,
+    CircleArtists,
+    SinePlotData,
+    create_bars,
+    create_circle,
+    create_mean_line,
+    create_sine,
+    plot_amplitudes,
+    plot_circle,
+    plot_sine,
+)
 from grovers_visualizer.state import QubitState
-from grovers_visualizer.utils import all_states, optimal_grover_iterations
+from grovers_visualizer.utils import all_state_labels, grover_angle, optimal_grover_iterations
 
 if TYPE_CHECKING:
+    from matplotlib.artist import Artist
     from matplotlib.axes import Axes
-    from matplotlib.container import BarContainer
     from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
 
 
 class GroverVisualizer:
     def __init__(self, target: QubitState, pause: float = 0.5) -> None:
         self.target: QubitState = target
         self.n: int = len(self.target)
-        self.basis_states: list[str] = [str(b) for b in all_states(self.n)]
+        self.basis_states: npt.NDArray[np.str_] = all_state_labels(self.n)
         self.optimal: int = optimal_grover_iterations(self.n)
-        self.theta: float = 2 * asin(1 / sqrt(2.0**self.n))
+        self.theta: float = grover_angle(self.n)
         self.state_angle: float = 0.5 * self.theta
         self.sine_data: SinePlotData = SinePlotData()
         self.is_running: bool = True
@@ -38,25 +51,69 @@ class GroverVisualizer:
         self.ax_circle: Axes = self.fig.add_subplot(gs[:, 1])
 
         # bars
-        self.bars: BarContainer = self.ax_bar.bar(self.basis_states, [0] * len(self.basis_states), color="skyblue")
+        self.bars: AmplitudeBars = create_bars(self.ax_bar, self.basis_states)
+        self.mean_line: Line2D = create_mean_line(self.ax_bar)
         self.ax_bar.set_ylim(-1, 1)
         self.ax_bar.set_title("Amplitudes (example)")
 
+        # circle and sine curve
+        self.circle: CircleArtists = create_circle(self.ax_circle)
+        self.sine_line: Line2D = create_sine(self.ax_sine)
+
+        # artists that change every frame; everything else is the cached background
+        self._animated: list[Artist] = [
+            self.bars.collection,
+            self.mean_line,
+            self.ax_bar.title,
+            self.circle.arrow,
+            self.circle.label,
+            self.ax_circle.title,
+            self.sine_line,
+        ]
+        for artist in self._animated:
+            artist.set_animated(True)
+        self._background: object | None = None
+
         # key handler to quit
         self.cid: int = self.fig.canvas.mpl_connect("key_press_event", self._on_key)
+        self.draw_cid: int = self.fig.canvas.mpl_connect("draw_event", self._on_draw)
 
     def _on_key(self, event: Event) -> None:
         if isinstance(event, KeyEvent) and event.key == "q":
             self.is_running = False
 
-    def update(self, iteration: int, sv: Statevector) -> None:
-        """Given (iteration, Statevector), update all three plots."""
+    def _on_draw(self, _event: DrawEvent | None) -> None:
+        """Cache the static background after every full redraw (first show, resize, rescale)."""
+        canvas = self.fig.canvas
+        if canvas.is_saving():  # `savefig` draws animated artists itself, at its own dpi
+            return
+        if isinstance(canvas, FigureCanvasAgg):
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self) -> None:
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+
+    def _blit(self, *, redraw: bool = False) -> None:
+        """Redraw only the animated artists on top of the cached background."""
+        canvas = self.fig.canvas
+        if redraw or self._background is None or not isinstance(canvas, FigureCanvasAgg):
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def update(self, iteration: int, amplitudes: npt.NDArray[np.complex64]) -> None:
+        """Given (iteration, amplitudes), update all three plots."""
         # amplitudes
         plot_amplitudes(
             self.ax_bar,
             self.bars,
-            sv,
-            self.basis_states,
+            self.mean_line,
+            amplitudes,
             "Grover Iteration",
             iteration,
             self.target,
@@ -66,6 +123,7 @@ class GroverVisualizer:
         # circle
         plot_circle(
             self.ax_circle,
+            self.circle,
             iteration,
             self.optimal,
             self.theta,
@@ -75,10 +133,18 @@ class GroverVisualizer:
         # sine curve
         self.sine_data.calc_and_append_probability(iteration, self.theta)
 
-        plot_sine(self.ax_sine, self.sine_data)
-        plt.pause(self.pause)
+        rescaled = plot_sine(self.ax_sine, self.sine_line, self.sine_data)
+
+        self._blit(redraw=rescaled)
+        # keep the GUI responsive (and `q` working) while waiting, unlike `time.sleep`;
+        # a timeout of 0 would run the event loop forever
+        if self.pause > 0:
+            self.fig.canvas.start_event_loop(self.pause)
 
     def finalize(self) -> None:
         """Clean up after loop ends."""
         self.fig.canvas.mpl_disconnect(self.cid)
+        self.fig.canvas.mpl_disconnect(self.draw_cid)
+        for artist in self._animated:
+            artist.set_animated(False)
         plt.ioff()